@@ -11,8 +11,8 @@
 #
 # Weather:N is mapped from OpenWeather condition id/icon.
 
-import os, sys, time, subprocess, re, glob, argparse, json, socket, urllib.parse, urllib.request, datetime
-import serial
+import os, sys, time, subprocess, re, glob, argparse, codecs, collections, concurrent.futures, functools, itertools, json, selectors, shutil, signal, socket, threading, urllib.parse, urllib.request, datetime
+# pyserial is imported lazily in open_serial() — keeps `--help` and arg errors fast
 
 # ===================== User Weather Settings (FREE endpoints) =====================
 # Set the API key through env: ATOMMAN_OWM_API="..." (preferred) or provide below:
@@ -23,6 +23,11 @@ OW_UNITS     = os.getenv("ATOMMAN_OWM_UNITS", "metric").strip()   # "metric" (°
 OW_LANG      = os.getenv("ATOMMAN_OWM_LANG", "pl").strip()        # description language
 # Cache refresh cadence (seconds). Env override: ATOMMAN_WEATHER_REFRESH
 WEATHER_REFRESH_SECONDS = int(os.getenv("ATOMMAN_WEATHER_REFRESH", "600"))
+# After a failed fetch (DNS down, API error) don't retry for this long
+WEATHER_NEGATIVE_TTL = 60.0
+# Expiry checks compare integer monotonic nanoseconds — no float math,
+# immune to wall-clock jumps. Derived once here at import.
+_REFRESH_NS = WEATHER_REFRESH_SECONDS * 1_000_000_000
 # ==============================================================================
 
 # -------- Config (env overrides) --------
@@ -34,7 +39,6 @@ TRAILER = b"\xCC\x33\xC3\x3C"
 
 DEFAULT_WAIT_START = float(os.getenv("ATOMMAN_WAIT_START", "3.0"))
 UNLOCK_WINDOW    = float(os.getenv("ATOMMAN_UNLOCK_SECONDS", "5.0"))
-POST_WRITE_SLEEP = float(os.getenv("ATOMMAN_WRITE_SLEEP", "0.006"))
 
 # Fan controls default via env, can be overridden by CLI
 ENV_FAN_PREFER   = os.getenv("ATOMMAN_FAN_PREFER", "auto").lower()   # auto|hwmon|nvidia
@@ -47,28 +51,35 @@ class C:
     DIM="\033[2m"; RESET="\033[0m"
 NOCOLOR = False
 def colorize(txt, color):
-    if NOCOLOR: return txt
-    return f"{color}{txt}{C.RESET}"
+    if NOCOLOR or not color: return txt
+    return color + txt + C.RESET  # plain concat beats f-string interpolation here
+# Threshold → color via index lookup: (v>=lo)+(v>=hi) picks green/yellow/red.
+# These return the ANSI prefix itself (empty on unparsable values) — callers pass
+# it to colorize(); no closure allocation per lookup.
+_GYR = (C.BG, C.BY, C.BR)
 def temp_color(t):
     try: t = float(t)
-    except: return lambda s: s
-    if t < 60:  return lambda s: colorize(s, C.BG)
-    if t < 80:  return lambda s: colorize(s, C.BY)
-    return            lambda s: colorize(s, C.BR)
+    except: return ""
+    return _GYR[(t >= 60) + (t >= 80)]
 def util_color(pct):
     try: pct=float(pct)
-    except: return lambda s: s
-    if pct < 40:  return lambda s: colorize(s, C.BG)
-    if pct < 80:  return lambda s: colorize(s, C.BY)
-    return               lambda s: colorize(s, C.BR)
+    except: return ""
+    return _GYR[(pct >= 40) + (pct >= 80)]
 def usage_color(pct):  # disk/mem usage
     try: pct=float(pct)
-    except: return lambda s: s
-    if pct < 70:  return lambda s: colorize(s, C.BG)
-    if pct < 90:  return lambda s: colorize(s, C.BY)
-    return               lambda s: colorize(s, C.BR)
+    except: return ""
+    return _GYR[(pct >= 70) + (pct >= 90)]
 
 # -------- Utilities --------
+# One wall-clock read per loop iteration: main() refreshes this via _tick() and
+# the per-tile helpers share it, so cache-expiry decisions stay coherent within
+# a tick instead of each helper sampling time.time() a few hundred µs apart.
+_TICK_NOW = time.time()
+def _tick() -> float:
+    global _TICK_NOW
+    _TICK_NOW = time.time()
+    return _TICK_NOW
+
 def _run(cmd, timeout=0.7):
     try:
         return subprocess.check_output(cmd, text=True, stderr=subprocess.DEVNULL, timeout=timeout)
@@ -80,51 +91,155 @@ def _read(path: str) -> str:
             return f.read()
     except Exception:
         return ""
+def _read_small(path: str, n: int = 256) -> str:
+    # For tiny sysfs/procfs values: raw os.open/os.read skips the BufferedReader
+    # + TextIOWrapper stack that open().read() builds per call
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return ""
+    try:
+        return os.read(fd, n).decode("ascii", "ignore")
+    except OSError:
+        return ""
+    finally:
+        os.close(fd)
+
+# Files polled every tick keep their fd open; pread from offset 0 rereads the
+# current contents and saves the openat+close pair per poll.
+_open_fds: dict[str, int] = {}
+def _pread(path: str, n: int = 65536) -> bytes:
+    fd = _open_fds.get(path)
+    if fd is None:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return b""
+        _open_fds[path] = fd
+    try:
+        return os.pread(fd, n, 0)
+    except OSError:
+        try: os.close(fd)
+        except OSError: pass
+        _open_fds.pop(path, None)  # stale fd (e.g. iface gone) — reopen next poll
+        return b""
+
+# Patterns used on every poll, compiled once (skips re's cache lookup per call)
+_RE_WS          = re.compile(r"\s+")
+_RE_GPU_CRUFT   = re.compile(r"\(R\)|\(TM\)|NVIDIA Corporation|Advanced Micro Devices,? Inc\.?|Intel\(R\)\s*", re.I)
+_RE_MHZ         = re.compile(r"CPU MHz:\s*([\d.]+)")
+_RE_DEV         = re.compile(r"\bdev\s+([^\s]+)")
+_RE_NONASCII    = re.compile(r"[^\x20-\x7E]")
+_RE_PART_SUFFIX = re.compile(r"p?\d+$")
+_RE_MANU        = re.compile(r"^\s*Manufacturer:\s*(.+)$", re.MULTILINE|re.IGNORECASE)
+_RE_LSHW_MANU   = re.compile(r"^\s*manufacturer:\s*(.+)$", re.MULTILINE|re.IGNORECASE)
+_RE_ROCM_TEMP   = re.compile(r"(\d+(\.\d+)?)\s*c", re.I)
+_RE_ROCM_USE    = re.compile(r"(\d+)\s*%")
+_RE_ROCM_NAME   = re.compile(r"GPU\[\d+\].*?\s(.*?)\s{2,}")
 
 # -------- CPU --------
+@functools.lru_cache(maxsize=1)
 def cpu_model() -> str:
+    # The model string never changes at runtime; parse /proc/cpuinfo once
     for ln in _read("/proc/cpuinfo").splitlines():
         if ln.startswith("model name"): return ln.split(":",1)[1].strip()
     return "Linux CPU"
+class CpuMeter:
+    # Stateful /proc/stat sampler (same idea as NetMeter below): usage is the
+    # delta since the previous call, so there is no blocking sleep in the
+    # reply path — the old implementation slept 80 ms per CPU tile.
+    def __init__(self):
+        self.idle0 = self.total0 = None
+        self.t0 = 0.0
+        self.last = 0
+        self._sample()
+    @staticmethod
+    def _snap():
+        # only the aggregate "cpu" line matters — no need to pull in
+        # (and split) one line per core just to throw them away
+        parts=_pread("/proc/stat", 1024).split(b"\n", 1)[0].split()[1:]
+        n=list(map(int,parts)); return n[3]+n[4], sum(n)
+    def _sample(self):
+        # Minimum-interval guard: p_cpu() and the dashboard dispatcher call
+        # back-to-back, and a delta of a jiffy or less quantizes to 0/100
+        # garbage. Keep the baseline and serve the cached value until enough
+        # time has passed for a meaningful delta.
+        now = time.monotonic()
+        if self.total0 is not None and now - self.t0 < 0.2:
+            return self.last
+        try:
+            idle,total=self._snap()
+        except Exception:
+            return self.last
+        if self.total0 is not None and total > self.total0:
+            pct=int(round(100*(1-((idle-self.idle0)/float(total-self.total0)))))
+            self.last=max(0,min(100,pct))
+        self.idle0,self.total0=idle,total
+        self.t0=now
+        return self.last
+    def usage_pct(self) -> int:
+        return self._sample()
+_cpu_meter = CpuMeter()
 def cpu_usage_pct() -> int:
-    def snap():
-        parts=_read("/proc/stat").splitlines()[0].split()[1:]
-        n=list(map(int,parts)); idle=n[3]+n[4]; total=sum(n)
-        return idle,total
-    i1,t1=snap(); time.sleep(0.08); i2,t2=snap()
-    di,dt=i2-i1, t2-t1
-    return max(0,min(100,int(round(100*(1-(di/float(dt or 1)))))))
+    return _cpu_meter.usage_pct()
 def cpu_freq_khz() -> int:
     for p in ("/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq",
               "/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_cur_freq"):
-        s=_read(p).strip()
+        s=_read_small(p).strip()
         if s.isdigit(): return max(0, int(s))  # already kHz
     out=_run(["lscpu"])
-    m=re.search(r"CPU MHz:\s*([\d.]+)",out)
+    m=_RE_MHZ.search(out)
     return int(float(m.group(1))*1000) if m else 0
+_cpu_temp_path = None  # hwmon sensor path discovered on first read; stable after boot
 def cpu_temp_c() -> int:
+    global _cpu_temp_path
+    if _cpu_temp_path:
+        try:
+            v=int(_read_small(_cpu_temp_path).strip()); return v//1000 if v>1000 else v
+        except Exception:
+            _cpu_temp_path=None  # sensor vanished — fall through and re-probe
     for hw in glob.glob("/sys/class/hwmon/hwmon*"):
         for n in range(8):
             p=f"{hw}/temp{n}_input"
             if os.path.exists(p):
                 try:
-                    v=int(open(p).read().strip()); return v//1000 if v>1000 else v
+                    v=int(_read_small(p).strip()); _cpu_temp_path=p; return v//1000 if v>1000 else v
                 except Exception: pass
     return 0
 
 # -------- FAN (RPM) --------
+_fan_paths = None  # fan*_input files discovered once; the set is stable after boot
+_hwmon_pool = None  # spun up only on boxes with enough sensors to be worth it
 def _fan_rpm_from_hwmon() -> int | None:
+    global _fan_paths, _hwmon_pool
+    if _fan_paths is None:
+        _fan_paths = [fan for hm in glob.glob("/sys/class/hwmon/hwmon*")
+                      for fan in glob.glob(os.path.join(hm, "fan*_input"))]
+    if len(_fan_paths) >= 3:
+        # i2c/USB-attached sensors can each take ms to read — overlap the I/O
+        if _hwmon_pool is None:
+            _hwmon_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="hwmon")
+        raws = list(_hwmon_pool.map(_read_small, _fan_paths))
+    else:
+        raws = [_read_small(fan) for fan in _fan_paths]
     best = None
-    for hm in glob.glob("/sys/class/hwmon/hwmon*"):
-        for fan in glob.glob(os.path.join(hm, "fan*_input")):
-            try:
-                v = int(open(fan).read().strip())
-                if v > 0:
-                    best = v if best is None else max(best, v)
-            except Exception:
-                pass
+    for raw in raws:
+        try:
+            v = int(raw.strip())
+            if v > 0:
+                best = v if best is None else max(best, v)
+        except Exception:
+            pass
     return best
 def _fan_rpm_from_nvidia(max_rpm: int) -> int | None:
+    if _gpu_backend is None:
+        _gpu_detect()
+    if _gpu_backend == "nvml":
+        try:
+            percent = float(pynvml.nvmlDeviceGetFanSpeed(_nvml_handle))
+            return int(round((percent/100.0)*max(1, int(max_rpm))))
+        except Exception:
+            return None
     out = _run(["nvidia-smi","--query-gpu=fan.speed","--format=csv,noheader,nounits"])
     if not out:
         return None
@@ -157,26 +272,46 @@ def fan_rpm(prefer: str, max_rpm: int) -> int:
 # -------- GPU (NVIDIA/AMD/Intel/fallback) --------
 def clean_gpu_name(name: str) -> str:
     s = name.strip()
-    s = re.sub(r"\(R\)|\(TM\)|NVIDIA Corporation|Advanced Micro Devices,? Inc\.?|Intel\(R\)\s*", "", s, flags=re.I)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _RE_GPU_CRUFT.sub("", s)
+    s = _RE_WS.sub(" ", s).strip()
     return s or "GPU"
-def gpu_info():
-    out = _run(["nvidia-smi","--query-gpu=name,temperature.gpu,utilization.gpu","--format=csv,noheader,nounits"])
-    if out:
+# NVML keeps a persistent driver handle — three C calls per query instead of a
+# fork/exec of nvidia-smi. Optional; the subprocess path remains as fallback.
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+# Vendor detection runs once; per-tick calls only query live telemetry from the
+# detected backend instead of trying nvidia-smi → rocm-smi → lspci every time.
+_gpu_backend = None   # "nvml" | "nvidia" | "rocm" | "static" | "none"
+_gpu_name = "GPU"
+_gpu_temp_path = None
+_nvml_handle = None
+
+def _gpu_detect():
+    global _gpu_backend, _gpu_name, _gpu_temp_path, _nvml_handle
+    if pynvml is not None:
         try:
-            name,temp,util=[x.strip() for x in out.splitlines()[0].split(",")]
-            return clean_gpu_name(name), int(temp), int(util)
+            pynvml.nvmlInit()
+            h = pynvml.nvmlDeviceGetHandleByIndex(0)
+            name = pynvml.nvmlDeviceGetName(h)
+            if isinstance(name, bytes): name = name.decode("utf-8", "ignore")
+            _nvml_handle = h
+            _gpu_backend = "nvml"
+            _gpu_name = clean_gpu_name(name)
+            return
         except Exception:
             pass
-    out = _run(["rocm-smi","--showtemp","--showuse"])
-    if out:
-        tm = re.search(r"(\d+(\.\d+)?)\s*c", out, re.I)
-        um = re.search(r"(\d+)\s*%", out)
-        temp = int(float(tm.group(1))) if tm else 0
-        util = int(um.group(1)) if um else 0
-        nm = re.search(r"GPU\[\d+\].*?\s(.*?)\s{2,}", out)
-        name = nm.group(1).strip() if nm else "AMD Radeon"
-        return clean_gpu_name(name), temp, util
+    if shutil.which("nvidia-smi"):
+        out = _run(["nvidia-smi","--query-gpu=name","--format=csv,noheader"], timeout=2.0)
+        if out.strip():
+            _gpu_backend = "nvidia"
+            _gpu_name = clean_gpu_name(out.splitlines()[0])
+            return
+    if shutil.which("rocm-smi"):
+        _gpu_backend = "rocm"
+        return
     name = ""
     for path in ("/sys/class/drm/card0/device/product_name",
                  "/sys/class/drm/card0/device/name"):
@@ -186,21 +321,64 @@ def gpu_info():
         pci = _run(["lspci","-mmnn"])
         m = re.search(r'VGA compatible controller \[0300\]\s+"([^"]+)"', pci)
         if m: name = m.group(1)
-    temp = 0
     for cand in glob.glob("/sys/class/drm/card0/device/hwmon/hwmon*/temp*_input"):
-        try: temp = int(open(cand).read().strip())//1000; break
-        except Exception: pass
+        _gpu_temp_path = cand; break
     if name:
-        return clean_gpu_name(name), temp, 0
+        _gpu_backend = "static"
+        _gpu_name = clean_gpu_name(name)
+    else:
+        _gpu_backend = "none"
+
+def gpu_info():
+    if _gpu_backend is None:
+        _gpu_detect()
+    if _gpu_backend == "nvml":
+        try:
+            temp = pynvml.nvmlDeviceGetTemperature(_nvml_handle, pynvml.NVML_TEMPERATURE_GPU)
+            util = pynvml.nvmlDeviceGetUtilizationRates(_nvml_handle).gpu
+            return _gpu_name, int(temp), int(util)
+        except Exception:
+            return _gpu_name, 0, 0
+    if _gpu_backend == "nvidia":
+        # name is cached — only ask for the fast telemetry counters
+        out = _run(["nvidia-smi","--query-gpu=temperature.gpu,utilization.gpu","--format=csv,noheader,nounits"])
+        try:
+            temp,util=[x.strip() for x in out.splitlines()[0].split(",")]
+            return _gpu_name, int(temp), int(util)
+        except Exception:
+            return _gpu_name, 0, 0
+    if _gpu_backend == "rocm":
+        out = _run(["rocm-smi","--showtemp","--showuse"])
+        tm = _RE_ROCM_TEMP.search(out)
+        um = _RE_ROCM_USE.search(out)
+        temp = int(float(tm.group(1))) if tm else 0
+        util = int(um.group(1)) if um else 0
+        nm = _RE_ROCM_NAME.search(out)
+        name = nm.group(1).strip() if nm else "AMD Radeon"
+        return clean_gpu_name(name), temp, util
+    if _gpu_backend == "static":
+        temp = 0
+        if _gpu_temp_path:
+            try: temp = int(_read_small(_gpu_temp_path).strip())//1000
+            except Exception: pass
+        return _gpu_name, temp, 0
     return "GPU", 0, 0
 
 # -------- Memory / Disk --------
 def mem_info():
-    d={}
-    for ln in _read("/proc/meminfo").splitlines():
-        parts=ln.replace(":","").split()
-        if len(parts)>=2 and parts[1].isdigit(): d[parts[0]]=int(parts[1])  # kB
-    total=d.get("MemTotal",0); avail=d.get("MemAvailable",0); used=max(0,total-avail)
+    # Only two of ~50 meminfo keys matter; stop scanning once both are seen
+    total=avail=0
+    try:
+        for ln in _pread("/proc/meminfo").splitlines():
+            if ln.startswith(b"MemTotal:"):
+                total=int(ln.split()[1])  # kB
+            elif ln.startswith(b"MemAvailable:"):
+                avail=int(ln.split()[1])  # kB
+            if total and avail:
+                break
+    except Exception:
+        pass
+    used=max(0,total-avail)
     to_gb=lambda kb: round(kb/1024.0/1024.0,1)
     usage=int(round(100.0*(used/float(total or 1))))
     return (to_gb(used),to_gb(avail),to_gb(total),usage)
@@ -213,32 +391,36 @@ def disk_numbers():
 
 # ---- RAM & Disk vendor (cached) ----
 _cache={"ram":("",0.0),"disk":("",0.0)}
-def _cache_get(k,ttl=3600):
-    v,t=_cache.get(k,("",0.0)); return v if v and time.time()-t<ttl else None
-def _cache_set(k,v): _cache[k]=(v,time.time())
-def ram_label():
-    cached=_cache_get("ram")
-    if cached is not None: return cached
+def _cache_get(k,ttl=float("inf")):  # vendor strings never change post-boot
+    v,t=_cache.get(k,("",0.0)); return v if v and _TICK_NOW-t<ttl else None
+def _cache_set(k,v): _cache[k]=(v,_TICK_NOW)
+def _ram_label_impl():
     manu=""
-    out = _run(["dmidecode","-t","memory"]) or _run(["sudo","-n","dmidecode","-t","memory"])
+    out = ""
+    if shutil.which("dmidecode"):  # don't exec tools that aren't installed
+        out = _run(["dmidecode","-t","memory"]) or _run(["sudo","-n","dmidecode","-t","memory"])
     if out:
-        m=re.search(r"^\s*Manufacturer:\s*(.+)$",out,re.MULTILINE|re.IGNORECASE)
+        m=_RE_MANU.search(out)
         if m:
             manu=m.group(1).strip()
             if manu in ("Undefined","Not Specified","Unknown","To Be Filled By O.E.M."): manu=""
-    if not manu:
+    if not manu and shutil.which("lshw"):
         out=_run(["lshw","-class","memory"])
         if out:
-            m=re.search(r"^\s*manufacturer:\s*(.+)$",out,re.MULTILINE|re.IGNORECASE)
+            m=_RE_LSHW_MANU.search(out)
             if m: manu=m.group(1).strip()
     manu=(manu.replace("Micron Technology","Micron")
                .replace("Samsung Electronics","Samsung")
                .replace("HYNIX","SK hynix")
                .replace("Hynix","SK hynix")).strip()
     _cache_set("ram",manu); return manu
-def disk_label():
-    cached=_cache_get("disk")
+def ram_label():
+    cached=_cache_get("ram")
     if cached is not None: return cached
+    if _labels_warming.is_set():
+        return ""  # pre-warm still running — don't block a serial reply on dmidecode
+    return _ram_label_impl()
+def _disk_label_impl():
     label=""
     try:
         for n in sorted(glob.glob("/sys/class/nvme/nvme*")):
@@ -251,7 +433,7 @@ def disk_label():
             root_dev=""
             try:
                 src=_run(["findmnt","-nro","SOURCE","/"]).strip()
-                root_dev=os.path.basename(re.sub(r"p?\d+$","",src.replace("/dev/","")))
+                root_dev=os.path.basename(_RE_PART_SUFFIX.sub("",src.replace("/dev/","")))
             except Exception: pass
             pick=None
             for ln in out.splitlines():
@@ -262,36 +444,54 @@ def disk_label():
                 if not root_dev and pick is None: pick=rest
             if pick: label=" ".join(pick).strip()
         except Exception: pass
-    label=re.sub(r"\s+"," ",label).strip()
+    label=_RE_WS.sub(" ",label).strip()
     _cache_set("disk",label); return label
+def disk_label():
+    cached=_cache_get("disk")
+    if cached is not None: return cached
+    if _labels_warming.is_set():
+        return ""  # pre-warm still running — don't block a serial reply on lsblk
+    return _disk_label_impl()
+
+_labels_warming = threading.Event()
+def _prewarm_labels():
+    # dmidecode/lshw/lsblk/GPU detection take hundreds of ms on first call —
+    # warm the caches in the background so early serial replies (including the
+    # unlock window) never stall on them. Tiles built meanwhile just show the
+    # vendor-less fallback labels.
+    try:
+        _ram_label_impl(); _disk_label_impl(); gpu_info()
+    finally:
+        _labels_warming.clear()
+_labels_warming.set()
+threading.Thread(target=_prewarm_labels, daemon=True).start()
 
 # ---------- Network (active iface picker, prefer LAN) ----------
 def _sh(cmd, timeout=0.6):
     try: return subprocess.check_output(cmd, text=True, stderr=subprocess.DEVNULL, timeout=timeout).strip()
     except Exception: return ""
+_wireless_cache: dict[str, bool] = {}  # wireless-ness of an iface never changes
 def _is_wireless(iface: str) -> bool:
-    return os.path.isdir(f"/sys/class/net/{iface}/wireless")
+    w = _wireless_cache.get(iface)
+    if w is None:
+        w = _wireless_cache[iface] = os.path.isdir(f"/sys/class/net/{iface}/wireless")
+    return w
 def _iface_info(iface: str) -> dict:
     info = {"name": iface, "up": False, "carrier": False, "wireless": _is_wireless(iface)}
-    try:
-        with open(f"/sys/class/net/{iface}/operstate") as f:
-            info["up"] = (f.read().strip() == "up")
-    except Exception:
-        pass
-    try:
-        with open(f"/sys/class/net/{iface}/carrier") as f:
-            info["carrier"] = (f.read().strip() == "1")
-    except Exception:
-        pass
+    info["up"] = (_pread(f"/sys/class/net/{iface}/operstate", 32).strip() == b"up")
+    info["carrier"] = (_pread(f"/sys/class/net/{iface}/carrier", 32).strip() == b"1")
     return info
 def _default_route_ifaces() -> list:
     out = _sh(["ip", "-o", "route", "show", "default"])
     devs = []
     for line in out.splitlines():
-        m = re.search(r"\bdev\s+([^\s]+)", line)
+        m = _RE_DEV.search(line)
         if m: devs.append(m.group(1))
     return list(dict.fromkeys(devs))
+@functools.lru_cache(maxsize=1)
 def _list_candidate_ifaces() -> list:
+    # NICs don't come and go in this workload; cache the sysfs listing for the
+    # process lifetime. SIGUSR1 clears it (e.g. after plugging a USB adapter).
     try:
         return [i for i in sorted(os.listdir("/sys/class/net")) if i != "lo"]
     except Exception:
@@ -319,20 +519,21 @@ def _pick_iface(preferred: str | None = None) -> str | None:
     pool=_list_candidate_ifaces()
     return pool[0] if pool else None
 def _read_netdev():
-    try:
-        with open("/proc/net/dev","r") as f:
-            return f.read().splitlines()
-    except Exception:
-        return []
-def _parse_netdev(lines, iface):
-    for ln in lines:
-        if ":" not in ln: continue
-        name, rest = ln.split(":", 1)
-        if name.strip() == iface:
-            cols = rest.split()
-            if len(cols) >= 16:
-                rx = int(cols[0]); tx = int(cols[8])
-                return rx, tx
+    return _pread("/proc/net/dev").decode("ascii", "ignore")
+def _parse_netdev(text, iface):
+    # Jump straight to the iface's line with str.find instead of iterating and
+    # splitting every line; the preceding char must be a space/newline so e.g.
+    # "eth0:" doesn't match inside "veth0:".
+    key = iface + ":"
+    i = text.find(key)
+    while i > 0 and text[i-1] not in " \n":
+        i = text.find(key, i + 1)
+    if i < 0:
+        return None, None
+    end = text.find("\n", i)
+    cols = text[i+len(key):end if end != -1 else len(text)].split()
+    if len(cols) >= 16:
+        return int(cols[0]), int(cols[8])
     return None, None
 class NetMeter:
     def __init__(self):
@@ -340,6 +541,7 @@ class NetMeter:
         self.iface = _pick_iface(env)
         self.rx0 = self.tx0 = None
         self.t0 = None
+        self._last_rank = 0.0
         self._prime()
     def _prime(self):
         if not self.iface: return
@@ -351,10 +553,17 @@ class NetMeter:
             lines = _read_netdev()
             rx, tx = _parse_netdev(lines, self.iface)
         if rx is not None:
-            self.rx0, self.tx0, self.t0 = rx, tx, time.time()
+            self.rx0, self.tx0, self.t0 = rx, tx, _TICK_NOW
     def maybe_repick(self):
         if not self.iface:
             self.iface = _pick_iface(); self._prime(); return
+        # Cheap per-tick check: a single operstate read of the current iface.
+        # The full candidate re-rank (3 syscalls per iface) runs at most every 10 s.
+        now = _TICK_NOW
+        if (_pread(f"/sys/class/net/{self.iface}/operstate", 32).strip() == b"up"
+                and now - self._last_rank < 10.0):
+            return
+        self._last_rank = now
         inf = _iface_info(self.iface)
         if not inf["up"] or (inf["wireless"] and not inf["carrier"]):
             new = _pick_iface()
@@ -369,7 +578,7 @@ class NetMeter:
         rx1, tx1 = _parse_netdev(lines, self.iface)
         if rx1 is None or self.rx0 is None:
             self._prime(); return None, None
-        t1 = time.time(); dt = max(1e-3, t1 - self.t0)
+        t1 = _TICK_NOW; dt = max(1e-3, t1 - self.t0)
         rxk = (rx1 - self.rx0) / dt / 1024.0
         txk = (tx1 - self.tx0) / dt / 1024.0
         self.rx0, self.tx0, self.t0 = rx1, tx1, t1
@@ -391,7 +600,67 @@ def _fmt_rate(rate_kbs: float) -> str:
     return f"{gbps:.1f} G/s"
 
 # ===================== OpenWeather integration (FREE endpoints + cache) =====================
-_weather_cache = {"ts": 0.0, "data": None, "warned_no_key": False}
+# Weather data survives restarts via a small JSON file keyed by (location,units,lang),
+# so a service restart inside the TTL window never blocks the serial loop on HTTPS.
+WEATHER_CACHE_FILE = os.getenv("ATOMMAN_WEATHER_CACHE", "/var/tmp/atomman_weather.json")
+# "ts" (wall clock) feeds the disk cache and the dashboard age display;
+# "fetched_ns" (monotonic ns) tells the refresher thread when data expires.
+_weather_cache = {"ts": 0.0, "data": None, "warned_no_key": False,
+                  "fetched_ns": -_REFRESH_NS}
+_weather_lock = threading.Lock()
+_geo_cache: dict[str, tuple] = {}  # OW_LOCATION → (lat, lon, zone), resolved once per process
+# City/ZIP geocoding results also persist on disk, so restarts skip the geo call too.
+GEO_CACHE_FILE = os.getenv("ATOMMAN_GEO_CACHE", "/var/tmp/atomman_geo.json")
+
+def _geo_disk_load():
+    try:
+        with open(GEO_CACHE_FILE, "r", encoding="utf-8") as f:
+            j = json.load(f)
+        v = j.get(OW_LOCATION)
+        if v and len(v) == 3:
+            _geo_cache[OW_LOCATION] = (float(v[0]), float(v[1]), str(v[2]))
+    except Exception:
+        pass
+
+def _geo_disk_store():
+    loc = _geo_cache.get(OW_LOCATION)
+    if not loc:
+        return
+    try:
+        tmp = GEO_CACHE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({OW_LOCATION: list(loc)}, f)
+        os.replace(tmp, GEO_CACHE_FILE)
+    except Exception:
+        pass
+
+def _weather_cache_key() -> str:
+    return f"{OW_LOCATION}|{OW_UNITS}|{OW_LANG}"
+
+def _weather_disk_load():
+    """Seed the in-RAM cache from disk if the stored entry matches our settings and is fresh."""
+    try:
+        with open(WEATHER_CACHE_FILE, "r", encoding="utf-8") as f:
+            j = json.load(f)
+        if j.get("key") != _weather_cache_key():
+            return
+        ts = float(j.get("ts", 0.0))
+        age = time.time() - ts
+        if 0.0 <= age < WEATHER_REFRESH_SECONDS and j.get("data"):
+            _weather_cache["data"] = j["data"]
+            _weather_cache["ts"] = ts
+            _weather_cache["fetched_ns"] = time.monotonic_ns() - int(age * 1e9)
+    except Exception:
+        pass
+
+def _weather_disk_store(data: dict):
+    try:
+        tmp = WEATHER_CACHE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": _weather_cache_key(), "ts": _weather_cache["ts"], "data": data}, f)
+        os.replace(tmp, WEATHER_CACHE_FILE)
+    except Exception:
+        pass
 
 def _internet_ok(host="8.8.8.8", port=53, timeout=1.5) -> bool:
     try:
@@ -401,10 +670,35 @@ def _internet_ok(host="8.8.8.8", port=53, timeout=1.5) -> bool:
     except Exception:
         return False
 
+# Persistent session so the TCP socket + TLS session are reused across refreshes
+# (urllib.request opens a fresh connection each time). Falls back to urllib when
+# requests isn't installed.
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    _SESSION = requests.Session()
+    _SESSION.headers["User-Agent"] = "AtomMan-Echo/1.0"
+    _adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5))
+    _SESSION.mount("https://", _adapter)
+    _SESSION.mount("http://", _adapter)
+except ImportError:
+    _SESSION = None
+
+# orjson parses the ~5-15 KB forecast payload 2-3x faster; stdlib json is fine too.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 def _http_get_json(url: str, timeout: float = 7.0) -> dict:
+    if _SESSION is not None:
+        r = _SESSION.get(url, timeout=timeout)
+        r.raise_for_status()
+        return _json_loads(r.content)
     req = urllib.request.Request(url, headers={"User-Agent": "AtomMan-Echo/1.0"})
     with urllib.request.urlopen(req, timeout=timeout) as r:
-        return json.loads(r.read().decode("utf-8", errors="replace"))
+        return _json_loads(r.read())
 
 def _parse_location_ow(loc: str, key: str):
     """Return (lat, lon, zone) or None. Accepts 'lat,lon' or 'City,CC' or 'ZIP,CC'."""
@@ -441,8 +735,7 @@ def _parse_location_ow(loc: str, key: str):
         return float(ent["lat"]), float(ent["lon"]), zone
     return None
 
-def _map_openweather_id_to_weatherN(ow_id: int, icon: str) -> int:
-    day = icon.endswith("d") if icon else True
+def _weatherN_ladder(ow_id: int, day: bool) -> int:
     if ow_id == 800:
         return 1 if day else 3                     # clear day/night
     if ow_id == 801:
@@ -479,15 +772,16 @@ def _map_openweather_id_to_weatherN(ow_id: int, icon: str) -> int:
         return 31
     return 99
 
-def _owm_current(lat: float, lon: float, key: str) -> dict:
-    qs = urllib.parse.urlencode({
-        "lat": f"{lat:.6f}",
-        "lon": f"{lon:.6f}",
-        "units": OW_UNITS,
-        "lang": OW_LANG,
-        "appid": key,
-    })
-    return _http_get_json(f"https://api.openweathermap.org/data/2.5/weather?{qs}")
+# The ladder above only runs at import time; lookups index these dense tables
+# (OpenWeather ids 200-804 fit comfortably in 1024 entries, values are byte-sized).
+_W_DAY   = bytes(_weatherN_ladder(i, True)  for i in range(1024))
+_W_NIGHT = bytes(_weatherN_ladder(i, False) for i in range(1024))
+
+def _map_openweather_id_to_weatherN(ow_id: int, icon: str) -> int:
+    day = icon.endswith("d") if icon else True
+    if 0 <= ow_id < 1024:
+        return (_W_DAY if day else _W_NIGHT)[ow_id]
+    return 99
 
 def _owm_forecast(lat: float, lon: float, key: str) -> dict:
     qs = urllib.parse.urlencode({
@@ -537,30 +831,30 @@ def _weather_fetch_now() -> dict | None:
     if not _internet_ok():
         return None
     try:
-        loc = _parse_location_ow(OW_LOCATION, key)
-        if not loc:
-            return None
+        loc = _geo_cache.get(OW_LOCATION)
+        if loc is None:
+            loc = _parse_location_ow(OW_LOCATION, key)
+            if not loc:
+                return None
+            _geo_cache[OW_LOCATION] = loc  # geocode City/ZIP once per process
+            _geo_disk_store()
         lat, lon, zone = loc
 
-        cur = _owm_current(lat, lon, key)        # FREE
-        fore = None
-        try:
-            fore = _owm_forecast(lat, lon, key)  # FREE
-        except Exception:
-            fore = None
-
-        # Current → id, icon, description
-        w = (cur.get("weather") or [{}])[0]
+        # One FREE /forecast call covers everything the DATE tile needs:
+        # the first 3h slot approximates current conditions, today's slots give lo/hi.
+        fore = _owm_forecast(lat, lon, key)
+        first = (fore.get("list") or [{}])[0]
+        w = (first.get("weather") or [{}])[0]
         owid = int(w.get("id", 0) or 0)
         icon = str(w.get("icon", "") or "")
         desc = str(w.get("description", "") or "")
 
         weatherN = _map_openweather_id_to_weatherN(owid, icon)
 
-        lohi = _compute_today_minmax_from_forecast(fore) if fore else None
+        lohi = _compute_today_minmax_from_forecast(fore)
         if lohi is None:
             # fallback: użyj bieżącej temp jako lo/hi
-            tnow = cur.get("main", {}).get("temp")
+            tnow = first.get("main", {}).get("temp")
             try:
                 tnow = float(tnow)
                 lo = hi = int(round(tnow))
@@ -569,20 +863,43 @@ def _weather_fetch_now() -> dict | None:
         else:
             lo, hi = lohi
 
-        zone_ascii = re.sub(r"[^\x20-\x7E]", "?", zone).replace(";", ",")
-        desc_ascii = re.sub(r"[^\x20-\x7E]", "?", desc).replace(";", ",")
+        zone_ascii = _RE_NONASCII.sub("?", zone).replace(";", ",")
+        desc_ascii = _RE_NONASCII.sub("?", desc).replace(";", ",")
         return {"weatherN": weatherN, "lo": lo, "hi": hi, "zone": zone_ascii, "desc": desc_ascii}
     except Exception:
         return None
 
-def get_weather_cached() -> dict | None:
-    now = time.time()
-    if _weather_cache["data"] is not None and (now - _weather_cache["ts"] < WEATHER_REFRESH_SECONDS):
-        return _weather_cache["data"]
+def _refresh_weather() -> bool:
+    """One refresh pass: replace the cached data only on success, keep stale otherwise."""
     data = _weather_fetch_now()
-    _weather_cache["data"] = data
-    _weather_cache["ts"] = now
-    return data
+    if data is None:
+        return False
+    with _weather_lock:
+        _weather_cache["data"] = data
+        _weather_cache["ts"] = time.time()
+        _weather_cache["fetched_ns"] = time.monotonic_ns()
+    _weather_disk_store(data)
+    return True
+
+def _weather_refresher():
+    # Dedicated daemon loop: every DNS/HTTP round-trip happens here, never on
+    # the tile threads. A disk-seeded cache waits out its remaining lifetime
+    # before the first fetch; a failed fetch retries after the negative TTL.
+    while True:
+        wait_ns = _weather_cache["fetched_ns"] + _REFRESH_NS - time.monotonic_ns()
+        if wait_ns > 0:
+            time.sleep(wait_ns / 1e9)
+        elif not _refresh_weather():
+            time.sleep(WEATHER_NEGATIVE_TTL)
+
+def get_weather_cached() -> dict | None:
+    # Pure dict read — the refresher thread owns all network I/O
+    return _weather_cache["data"] if OW_API_KEY else None
+
+_weather_disk_load()
+_geo_disk_load()
+if OW_API_KEY:
+    threading.Thread(target=_weather_refresher, daemon=True).start()
 # =================== End OpenWeather integration ===================
 
 # -------- Tile payload generators --------
@@ -608,25 +925,41 @@ def p_dsk():
     lab=disk_label() or "Disk"
     return f"{{DiskName:{lab};Tempr:33;UsageSpace:{used};AllSpace:{total};Usage:{usage}}}"
 
-def p_date():
+# Date/Time/Week are the only volatile DATE fields; the weather tail is rebuilt
+# only when the cached weather dict changes (once per refresh).
+_DATE_PREFIX_TMPL = "{Date:%04d/%02d/%02d;Time:%02d:%02d:%02d;Week:%d;"
+# format_map against the cached weather dict directly — its keys are the fields
+_WEATHER_SUFFIX_TMPL = "Weather:{weatherN};TemprLo:{lo},TemprHi:{hi},Zone:{zone},Desc:{desc}}}"
+_EMPTY_WEATHER_SUFFIX = "Weather:;TemprLo:,TemprHi:,Zone:,Desc:}"
+_suffix_cache = {"w": None, "s": _EMPTY_WEATHER_SUFFIX}
+_date_prefix_cache = [-1, ""]  # [epoch second, formatted prefix]
+
+def _date_prefix() -> str:
+    # ENQs arrive faster than 1/s but the prefix only changes on second boundaries.
+    now = int(_TICK_NOW)
+    if now != _date_prefix_cache[0]:
+        t = time.localtime(now)
+        _date_prefix_cache[0] = now
+        _date_prefix_cache[1] = _DATE_PREFIX_TMPL % (
+            t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec,
+            _week_num_from_localtime(t)
+        )
+    return _date_prefix_cache[1]
+
+def _p_date_weather():
     # ALWAYS full payload; weather fields may be blank
-    t=time.localtime()
-    week_num = _week_num_from_localtime(t)
     w = get_weather_cached()
-    if w:
-        return (
-            f"{{Date:{t.tm_year:04d}/{t.tm_mon:02d}/{t.tm_mday:02d};"
-            f"Time:{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d};"
-            f"Week:{week_num};Weather:{w['weatherN']};"
-            f"TemprLo:{w['lo']},TemprHi:{w['hi']},"
-            f"Zone:{w['zone']},Desc:{w['desc']}}}"
-        )
-    else:
-        return (
-            f"{{Date:{t.tm_year:04d}/{t.tm_mon:02d}/{t.tm_mday:02d};"
-            f"Time:{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d};"
-            f"Week:{week_num};Weather:;TemprLo:,TemprHi:,Zone:,Desc:}}"
-        )
+    if w is not _suffix_cache["w"]:
+        _suffix_cache["w"] = w
+        _suffix_cache["s"] = _WEATHER_SUFFIX_TMPL.format_map(w) if w else _EMPTY_WEATHER_SUFFIX
+    return _date_prefix() + _suffix_cache["s"]
+
+def _p_date_no_weather():
+    return _date_prefix() + _EMPTY_WEATHER_SUFFIX
+
+# Specialize at import: without an API key the DATE builder is two constant
+# concatenations and the weather cache/threads are never touched.
+p_date = _p_date_weather if OW_API_KEY else _p_date_no_weather
 
 def p_net(fan_prefer: str, fan_max_rpm: int):
     rxk, txk = _nm.rates_ks()                    # sample once per NET tile visit
@@ -636,107 +969,337 @@ def p_net(fan_prefer: str, fan_max_rpm: int):
         return f"{{SPEED:{rpm};NETWORK:N/A,N/A}}"
     return f"{{SPEED:{rpm};NETWORK:{_fmt_rate(rxk)},{_fmt_rate(txk)}}}"
 
-def p_vol():
+# Volume and battery barely move between rotation slots: cache the raw values
+# so the pactl fork+exec and the power_supply discovery don't run per tile.
+try:
+    import pulsectl  # optional: a persistent libpulse connection beats forking pactl
+except ImportError:
+    pulsectl = None
+_pulse = None        # lazy: the PulseAudio daemon may not be up when we start
+
+def _volume_read() -> int:
+    global _pulse
+    if pulsectl is not None:
+        try:
+            if _pulse is None:
+                _pulse = pulsectl.Pulse("atomman")
+            return int(round(_pulse.sink_default_get().volume.value_flat * 100))
+        except Exception:
+            # daemon restarted or went away — drop the connection and let the
+            # pactl fallback answer this round; reconnect on the next read
+            try:
+                if _pulse is not None: _pulse.close()
+            except Exception: pass
+            _pulse = None
     out=_run(["pactl","get-sink-volume","@DEFAULT_SINK@"], timeout=0.7)
-    m=re.search(r"(\d+)%",out); vol=int(m.group(1)) if m else -1
-    return f"{{VOLUME:{vol}}}"
+    # "... 65536 / 100% / ..." — find the first '%' and scan back over digits
+    i = out.find("%")
+    j = i
+    while j > 0 and out[j-1].isdigit():
+        j -= 1
+    return int(out[j:i]) if 0 <= j < i else -1
 
-def p_bat():
+# Expired values refresh on this pool while the reply goes out with the last
+# known reading — a wedged pactl (0.7 s timeout) can no longer stall an ENQ.
+_slow_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+_vol_cache = [0.0, -1, False]   # [stamp, pct, refresh in flight]
+def _vol_refresh():
     try:
-        for base in os.listdir("/sys/class/power_supply"):
-            if base.startswith("BAT"):
-                with open(f"/sys/class/power_supply/{base}/capacity") as f:
-                    return f"{{Battery:{int(f.read().strip())}}}"
-    except Exception: pass
-    return "{Battery:177}"
+        _vol_cache[1] = _volume_read()
+        _vol_cache[0] = time.time()
+    finally:
+        _vol_cache[2] = False
+def volume_pct() -> int:
+    if _TICK_NOW - _vol_cache[0] > 2.0 and not _vol_cache[2]:
+        _vol_cache[2] = True
+        _slow_pool.submit(_vol_refresh)
+    return _vol_cache[1]
+
+_bat_path = None                # discovered once; "" when the box has no battery
+_bat_cache = [0.0, 177, False]  # [stamp, pct, refresh in flight] — 177 = "no battery"
+def _bat_refresh():
+    global _bat_path
+    try:
+        if _bat_path is None:
+            g = glob.glob("/sys/class/power_supply/BAT*/capacity")
+            _bat_path = g[0] if g else ""
+        pct = 177
+        if _bat_path:
+            # _pread keeps the sysfs node open: no openat/close pair per poll
+            try: pct = int(_pread(_bat_path, 16).strip())
+            except Exception: pass
+        _bat_cache[1] = pct
+        _bat_cache[0] = time.time()
+    finally:
+        _bat_cache[2] = False
+def battery_pct() -> int:
+    if _TICK_NOW - _bat_cache[0] > 15.0 and not _bat_cache[2]:
+        _bat_cache[2] = True
+        _slow_pool.submit(_bat_refresh)
+    return _bat_cache[1]
+
+# Payload strings rebuilt only when the underlying value moves — at >1 reply/s
+# the same volume/battery text would otherwise be re-formatted every rotation.
+_vol_payload = [None, "{VOLUME:-1}"]
+def p_vol():
+    v = volume_pct()
+    if v != _vol_payload[0]:
+        _vol_payload[0] = v; _vol_payload[1] = f"{{VOLUME:{v}}}"
+    return _vol_payload[1]
+
+_bat_payload = [None, "{Battery:177}"]
+def p_bat():
+    v = battery_pct()
+    if v != _bat_payload[0]:
+        _bat_payload[0] = v; _bat_payload[1] = f"{{Battery:{v}}}"
+    return _bat_payload[1]
 
 # Tile IDs & rotations
 CPU, GPU, MEM, DSK, DAT, NET, VOL, BAT = 0x53,0x36,0x49,0x4F,0x6B,0x27,0x10,0x1A
 UNLOCK_ROT = [(CPU,p_cpu),(GPU,p_gpu),(MEM,p_mem)]  # reliable unlock
 
 # -------- Per-tile SEQ mapping (CPU='2') --------
-SEQ_FOR = {CPU:'2', GPU:'3', MEM:'4', DSK:'5', DAT:'6', NET:'7', VOL:'9', BAT:'2'}
+# Pre-ord'd int→int table: one dict.get per reply, no string handling
+_SEQ_BYTE = {CPU:ord('2'), GPU:ord('3'), MEM:ord('4'), DSK:ord('5'),
+             DAT:ord('6'), NET:ord('7'), VOL:ord('9'), BAT:ord('2')}
+_SEQ_DEFAULT = ord('2')
 def seq_for(tile_id: int) -> int:
-    ch = SEQ_FOR.get(tile_id, '2')
-    return (ord('<') if ch == '<' else ord(ch))
+    return _SEQ_BYTE.get(tile_id, _SEQ_DEFAULT)
 
 # -------- Protocol --------
-def read_enq(ser):
-    b = ser.read(1)
-    if b!=b"\xAA": return None
-    if ser.read(1)!=b"\x05": return None
-    b3=ser.read(1)
-    if not b3: return None
-    if ser.read(4)!=TRAILER: return None
-    return b3[0]  # ASCII during BOOT; tile_id during NORMAL (panel quirk)
+_ENQ_RE = re.compile(rb"\xAA\x05(.)\xCC\x33\xC3\x3C", re.DOTALL)  # compiled once, matched on raw bytes
+_rxbuf = bytearray()
+# Persistent epoll registration (selectors picks epoll on Linux): select.select()
+# rebuilt and re-walked its fd set in the kernel on every call, epoll registers once.
+_rx_sel = None
+_rx_sel_ser = None
+_rx_fd = -1
+
+def _wait_readable(ser, timeout):
+    global _rx_sel, _rx_sel_ser, _rx_fd
+    if _rx_sel_ser is not ser:
+        if _rx_sel is not None:
+            _rx_sel.close()
+        _rx_sel = selectors.DefaultSelector()
+        _rx_sel.register(ser, selectors.EVENT_READ)
+        _rx_sel_ser = ser
+        _rx_fd = ser.fileno()
+        os.set_blocking(_rx_fd, False)
+    return _rx_sel.select(timeout)
+
+def _nap_drain(ser, secs):
+    # Sleep between DTR toggles inside the epoll wait, discarding whatever the
+    # panel emits mid-reset so the next attempt never parses stale frames.
+    end = time.monotonic() + secs
+    while True:
+        left = end - time.monotonic()
+        if left <= 0:
+            break
+        if _wait_readable(ser, left):
+            try: os.read(_rx_fd, 512)
+            except OSError: pass
+    _rxbuf.clear()
+
+def read_enq(ser, poll=0.05):
+    m = _ENQ_RE.search(_rxbuf)
+    if m is None:
+        # Non-blocking port: sleep in epoll until RX has bytes (or poll expires),
+        # then pull straight from the fd — Serial.read() re-runs its own
+        # select/timeout bookkeeping per call that the wait already did.
+        # Drain everything queued in one wakeup: a burst of ENQs costs one
+        # epoll_wait plus however many reads it takes, not one wakeup each.
+        if _wait_readable(ser, poll):
+            while True:
+                try:
+                    chunk = os.read(_rx_fd, 512)
+                except (BlockingIOError, InterruptedError):
+                    break  # drained (or readiness raced a spurious wakeup)
+                if not chunk:
+                    break
+                _rxbuf.extend(chunk)
+                if len(chunk) < 512:
+                    break  # short read — the queue is empty
+        m = _ENQ_RE.search(_rxbuf)
+    if m is None:
+        del _rxbuf[:-6]  # keep at most one partial frame (full ENQ is 7 bytes)
+        return None
+    seq = m.group(1)[0]
+    del _rxbuf[:m.end()]
+    return seq  # ASCII during BOOT; tile_id during NORMAL (panel quirk)
+# "AA <TileID> 00" never changes per tile — build each prefix once
+_REPLY_PREFIX = {tid: bytes([0xAA, tid, 0x00]) for tid in (CPU,GPU,MEM,DSK,DAT,NET,VOL,BAT)}
+_BYTE = tuple(bytes((i,)) for i in range(256))    # single-byte singletons for the seq field
+_ENC_LATIN1 = codecs.getencoder("latin-1")       # pre-bound: skips the codec registry lookup
+
+# Per-tile specialized builders: each closure owns a scratch buffer whose
+# 3-byte header is written once at startup, so the per-reply work is seq byte,
+# payload memcpy, trailer. Closures over pre-bound locals — no exec, no dict
+# of prefixes consulted per call.
+def _make_builder(tid):
+    buf = bytearray(1024)
+    buf[:3] = _REPLY_PREFIX[tid]
+    mv = memoryview(buf)
+    enc = _ENC_LATIN1
+    trailer = TRAILER
+    def build(seq_ascii, txt):
+        body = enc(txt, "ignore")[0]
+        buf[3] = seq_ascii
+        end = 4 + len(body)
+        buf[4:end] = body
+        buf[end:end+4] = trailer
+        return mv[:end+4]
+    return build
+
+_BUILD_SPECIAL = {tid: _make_builder(tid) for tid in _REPLY_PREFIX}
+
 def build_reply(id_byte:int, seq_ascii:int, txt:str)->bytes:
-    return bytes([0xAA,id_byte,0x00,seq_ascii]) + txt.encode("latin-1","ignore") + TRAILER
+    pre = _REPLY_PREFIX.get(id_byte) or bytes([0xAA, id_byte, 0x00])
+    # b"".join sizes the result once — the old chained + built three intermediates
+    return b"".join((pre, _BYTE[seq_ascii], _ENC_LATIN1(txt, "ignore")[0], TRAILER))
+def _set_low_latency(port: str):
+    # FTDI adapters default to a 16 ms latency_timer, capping ENQ→REPLY round-trips
+    # at ~60 Hz. Drop it to 1 ms when the sysfs node exists (CDC-ACM devices don't
+    # have it; on Windows the same knob lives in the FTDI Advanced Settings dialog).
+    try:
+        tty = os.path.basename(os.path.realpath(port))
+        with open(f"/sys/bus/usb-serial/devices/{tty}/latency_timer", "w") as f:
+            f.write("1")
+    except OSError:
+        pass
+
+# TIOCGSERIAL / TIOCSSERIAL / ASYNC_LOW_LATENCY (asm-generic values)
+_TIOCGSERIAL, _TIOCSSERIAL, _ASYNC_LOW_LATENCY = 0x541E, 0x541F, 0x2000
+
+def _set_async_low_latency(ser):
+    # Kernel-side counterpart of the sysfs knob above: flips ASYNC_LOW_LATENCY
+    # in struct serial_struct.flags so the tty layer pushes RX up per byte
+    # instead of per wakeup. Drivers without the ioctl (CDC-ACM) or EPERM
+    # simply leave the flag unset.
+    try:
+        import fcntl
+        buf = bytearray(72)  # struct serial_struct, with padding headroom
+        fcntl.ioctl(ser.fileno(), _TIOCGSERIAL, buf)
+        flags = int.from_bytes(buf[16:20], sys.byteorder) | _ASYNC_LOW_LATENCY
+        buf[16:20] = flags.to_bytes(4, sys.byteorder)
+        fcntl.ioctl(ser.fileno(), _TIOCSSERIAL, bytes(buf))
+    except Exception:
+        pass
+
+def _poll_to_next_second(max_poll: float = 0.25) -> float:
+    # Idle select() timeout aligned to the wall-clock tick: the steady-state loop
+    # wakes exactly when the Time field changes instead of at an arbitrary cadence.
+    now = time.time()
+    return min(max_poll, max(0.001, 1.0 - (now - int(now))))
+
 def open_serial(wait_start: float):
+    import serial  # deferred: not needed for --help / argparse failures
     time.sleep(wait_start)  # allow USB CDC / drivers / fans to come up
-    s=serial.Serial(PORT,BAUD,timeout=1.0,write_timeout=1.0,dsrdtr=DSRDTR,rtscts=RTSCTS)
+    _set_low_latency(PORT)
+    s=serial.Serial(PORT,BAUD,timeout=0,write_timeout=1.0,dsrdtr=DSRDTR,rtscts=RTSCTS)
+    _set_async_low_latency(s)
     try:
         s.reset_input_buffer(); s.reset_output_buffer()
     except Exception: pass
     return s
 
 # -------- Dashboard (optional) --------
-def render_dashboard(latest):
-    sys.stdout.write("\033[2J\033[H")  # clear + home
-    t=time.strftime("%Y-%m-%d %H:%M:%S")
-    print(f"{colorize('AtomMan — Active', C.BW)}   Time: {colorize(t, C.BC)}")
-    print("-"*72)
+def _dash_lines(latest, now):
+    """Compose the dashboard as a list of lines (no escapes, no I/O)."""
+    out = [f"{colorize('AtomMan — Active', C.BW)}   Time: {colorize(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)), C.BC)}",
+           "-"*72]
+    add = out.append
     tc = temp_color(latest.get('cpu_temp','?'))
     uc = util_color(latest.get('cpu_usage','?'))
-    print(f"Processor type : {latest.get('cpu_model','')}")
-    print(f"Processor temp : {tc(str(latest.get('cpu_temp','?')) + ' °C')}")
-    print(f"CPU usage      : {uc(str(latest.get('cpu_usage','?')) + ' %')}")
-    print(f"CPU freq       : {str(latest.get('cpu_freq_khz','?'))} kHz")
-    print()
+    add(f"Processor type : {latest.get('cpu_model','')}")
+    add(f"Processor temp : {colorize(str(latest.get('cpu_temp','?')) + ' °C', tc)}")
+    add(f"CPU usage      : {colorize(str(latest.get('cpu_usage','?')) + ' %', uc)}")
+    add(f"CPU freq       : {str(latest.get('cpu_freq_khz','?'))} kHz")
+    add("")
     gname = latest.get('gpu_name','N/A')
     gtc = temp_color(latest.get('gpu_temp','0'))
     guc = util_color(latest.get('gpu_util','0'))
-    print(f"GPU model      : {gname}")
-    print(f"GPU temp       : {gtc(str(latest.get('gpu_temp','0')) + ' °C')}")
-    print(f"GPU usage      : {guc(str(latest.get('gpu_util','0')) + ' %')}")
-    print()
+    add(f"GPU model      : {gname}")
+    add(f"GPU temp       : {colorize(str(latest.get('gpu_temp','0')) + ' °C', gtc)}")
+    add(f"GPU usage      : {colorize(str(latest.get('gpu_util','0')) + ' %', guc)}")
+    add("")
     muc = usage_color(latest.get('mem_usage','?'))
-    print(f"RAM (vendor)   : {latest.get('ram_vendor','')}")
-    print(f"RAM used       : {str(latest.get('mem_used','?'))} GB")
-    print(f"RAM avail      : {str(latest.get('mem_avail','?'))} GB")
-    print(f"RAM total      : {str(latest.get('mem_total','?'))} GB")
-    print(f"RAM usage      : {muc(str(latest.get('mem_usage','?')) + ' %')}")
-    print()
+    add(f"RAM (vendor)   : {latest.get('ram_vendor','')}")
+    add(f"RAM used       : {str(latest.get('mem_used','?'))} GB")
+    add(f"RAM avail      : {str(latest.get('mem_avail','?'))} GB")
+    add(f"RAM total      : {str(latest.get('mem_total','?'))} GB")
+    add(f"RAM usage      : {colorize(str(latest.get('mem_usage','?')) + ' %', muc)}")
+    add("")
     duc = usage_color(latest.get('disk_usage','?'))
-    print(f"Disk (label)   : {latest.get('disk_label','')}")
-    print(f"Disk used      : {str(latest.get('disk_used','?'))} GB")
-    print(f"Disk total     : {str(latest.get('disk_total','?'))} GB")
-    print(f"Disk usage     : {duc(str(latest.get('disk_usage','?')) + ' %')}")
-    print()
+    add(f"Disk (label)   : {latest.get('disk_label','')}")
+    add(f"Disk used      : {str(latest.get('disk_used','?'))} GB")
+    add(f"Disk total     : {str(latest.get('disk_total','?'))} GB")
+    add(f"Disk usage     : {colorize(str(latest.get('disk_usage','?')) + ' %', duc)}")
+    add("")
     iface = latest.get('iface', 'N/A')
-    print(f"Net iface      : {iface}")
+    add(f"Net iface      : {iface}")
     rx = latest.get('net_rx', None)
     tx = latest.get('net_tx', None)
-    print(f"Net RX,TX      : {_fmt_rate(rx)}, {_fmt_rate(tx)}")
-    print(f"Fan speed      : {str(latest.get('fan_rpm','-1'))} r/min")
-    print(f"Volume         : {str(latest.get('volume','-1'))} %")
-    print(f"Battery        : {str(latest.get('battery','177'))} %")
-    print()
+    add(f"Net RX,TX      : {_fmt_rate(rx)}, {_fmt_rate(tx)}")
+    add(f"Fan speed      : {str(latest.get('fan_rpm','-1'))} r/min")
+    add(f"Volume         : {str(latest.get('volume','-1'))} %")
+    add(f"Battery        : {str(latest.get('battery','177'))} %")
+    add("")
     # --- Weather block (from cache) ---
     w = get_weather_cached()
     if w:
-        print(colorize("Weather        : ONLINE", C.BG))
+        add(colorize("Weather        : ONLINE", C.BG))
         unit_label = "°C" if OW_UNITS == "metric" else "°F"
-        print(f"  Code         : {w['weatherN']} (mapped)")
-        print(f"  Lo/Hi        : {w['lo']}/{w['hi']} {unit_label}")
-        print(f"  Zone         : {w['zone']}")
-        print(f"  Desc         : {w['desc']}")
-        age = int(time.time() - _weather_cache['ts'])
-        print(f"  Age          : {age}s (refresh {WEATHER_REFRESH_SECONDS}s)")
+        add(f"  Code         : {w['weatherN']} (mapped)")
+        add(f"  Lo/Hi        : {w['lo']}/{w['hi']} {unit_label}")
+        add(f"  Zone         : {w['zone']}")
+        add(f"  Desc         : {w['desc']}")
+        age = int(now - _weather_cache['ts'])
+        add(f"  Age          : {age}s (refresh {WEATHER_REFRESH_SECONDS}s)")
     else:
         reason = "no API key" if not OW_API_KEY else "offline/unavailable"
-        print(colorize(f"Weather        : OFFLINE ({reason})", C.BY))
-    print("-"*72)
-    sys.stdout.flush()
+        add(colorize(f"Weather        : OFFLINE ({reason})", C.BY))
+    add("-"*72)
+    return out
+
+def _dashboard_loop(latest):
+    # Terminal I/O on its own daemon thread: a slow pty can stall stdout for
+    # tens of ms, which must not delay serial replies. dict(latest) is a
+    # C-level copy under the GIL, i.e. a consistent point-in-time snapshot.
+    # After the first full paint only changed lines are re-addressed, so a
+    # quiet dashboard writes a few dozen bytes per frame instead of ~1.5 KiB.
+    prev = []
+    prev_snap = None
+    prev_sec = -1
+    while True:
+        try:
+            # Own clock sample: _TICK_NOW belongs to the serial loop, which
+            # doesn't tick during the unlock phase — the dashboard clock and
+            # weather age must not freeze with it.
+            now = time.time()
+            snap = dict(latest)
+            sec = int(now)
+            # Identical data within the same displayed second would compose the
+            # exact same lines — skip the frame outright, don't just diff it away.
+            if snap != prev_snap or sec != prev_sec or not prev:
+                lines = _dash_lines(snap, now)
+                if len(lines) != len(prev):
+                    sys.stdout.write("\033[2J\033[H" + "\n".join(lines) + "\n")
+                    sys.stdout.flush()
+                else:
+                    buf = [f"\033[{i+1};1H\033[2K{ln}"
+                           for i, ln in enumerate(lines) if ln != prev[i]]
+                    if buf:
+                        buf.append(f"\033[{len(lines)+1};1H")
+                        sys.stdout.write("".join(buf))
+                        sys.stdout.flush()
+                prev = lines
+                prev_snap = snap
+                prev_sec = sec
+        except Exception:
+            prev = []
+            prev_snap = None
+        time.sleep(0.25)
 
 def update_latest_from_payload(id_byte, latest, fan_prefer, fan_max_rpm):
     if id_byte==CPU:
@@ -776,42 +1339,46 @@ def update_latest_from_payload(id_byte, latest, fan_prefer, fan_max_rpm):
             "iface": _nm.iface or "N/A"
         })
     elif id_byte==VOL:
-        out=_run(["pactl","get-sink-volume","@DEFAULT_SINK@"], timeout=0.7)
-        m=re.search(r"(\d+)%",out); vol=int(m.group(1)) if m else -1
-        latest.update({"volume": vol})
+        latest.update({"volume": volume_pct()})
     elif id_byte==BAT:
-        pct=None
-        try:
-            for base in os.listdir("/sys/class/power_supply"):
-                if base.startswith("BAT"):
-                    with open(f"/sys/class/power_supply/{base}/capacity") as f:
-                        pct=int(f.read().strip()); break
-        except Exception: pass
-        latest.update({"battery": pct if pct is not None else 177})
-    elif id_byte==DAT:
-        get_weather_cached()
+        latest.update({"battery": battery_pct()})
+    # DAT carries no dashboard state: the weather refresher thread owns every
+    # fetch and p_date() reads its cache, so there is nothing to do per tile.
 
 # -------- Activation + Retry + Main loop --------
-def is_ascii_seq(b): return (0x30<=b<=0x39) or (b==0x3C)
+# '0'-'9' or '<' — one LUT read per ENQ instead of a call + comparison chain
+_ASCII_SEQ = bytes(1 if (0x30 <= i <= 0x39) or i == 0x3C else 0 for i in range(256))
 
-def unlock_attempt(ser, attempt_idx, latest, unlock_window, fan_prefer, fan_max_rpm, dashboard):
+def unlock_attempt(ser, attempt_idx, latest, unlock_window, fan_prefer, fan_max_rpm):
     print(f"[Attempt {attempt_idx}/3] Unlock window {unlock_window:.0f}s — echoing SEQ with CPU→GPU→MEM")
-    start=time.time(); idx=0; boot_replies=0; enq_times=[]; activated=False
-    while time.time()-start < unlock_window:
+    start=time.monotonic(); boot_replies=0; activated=False
+    enq_times=collections.deque()  # sliding 2 s window; expired entries pop off the head
+    # Payload content is frozen for the attempt: build each rotation frame once
+    # and per ENQ just patch the seq byte (offset 3) before writing. The panel
+    # only cares that SEQ echoes back fast, not that telemetry is fresh.
+    frames=[]
+    for tile, maker in UNLOCK_ROT:
+        frames.append((tile, bytearray(build_reply(tile, 0x30, maker()))))
+        update_latest_from_payload(tile, latest, fan_prefer, fan_max_rpm)
+    frames=itertools.cycle(frames)  # C-level rotation: no idx, no modulo
+    while True:
+        # One clock read per iteration (monotonic: the activation window must
+        # not stretch or shrink with wall-clock jumps); reused below.
+        now=time.monotonic()
+        if now-start >= unlock_window:
+            break
         seq=read_enq(ser)
         if seq is None:
-            if dashboard:
-                render_dashboard(latest)
             continue
-        enq_times.append(time.time())
-        enq_times=[t for t in enq_times if time.time()-t <= 2.0]
-        tile, maker = UNLOCK_ROT[idx % len(UNLOCK_ROT)]
-        payload = maker()
-        frm = build_reply(tile, seq, payload)  # echo seq during unlock
-        ser.write(frm); ser.flush(); time.sleep(POST_WRITE_SLEEP)
-        update_latest_from_payload(tile, latest, fan_prefer, fan_max_rpm)
-        idx += 1
-        if is_ascii_seq(seq): boot_replies += 1
+        enq_times.append(now)
+        while enq_times and now-enq_times[0] > 2.0:
+            enq_times.popleft()
+        tile, frm = next(frames)
+        frm[3] = seq  # echo seq during unlock
+        # No flush/sleep here: write() lands in the kernel tty buffer and the
+        # next ENQ provides the pacing — draining per frame serialized USB I/O
+        ser.write(frm)
+        if _ASCII_SEQ[seq]: boot_replies += 1
         if (boot_replies >= 3) and (len(enq_times) >= 5):
             activated=True
             print(f"[Attempt {attempt_idx}] Activated (ENQs flowing).")
@@ -834,25 +1401,31 @@ def main():
     ap.add_argument("--fan-prefer", choices=["auto","hwmon","nvidia"], default=ENV_FAN_PREFER,
                     help="Preferred fan source (auto tries hwmon then NVIDIA)")
     ap.add_argument("--fan-max-rpm", type=int, default=ENV_FAN_MAX_RPM,
-                    help="Used only when NVIDIA reports percent; RPM = % * this / 100")
+                    help="Used only when NVIDIA reports percent; RPM = %% * this / 100")
     args=ap.parse_args()
     NOCOLOR = args.no_color
 
+    # Rescan NICs on demand (kill -USR1) instead of re-listing sysfs every pick
+    signal.signal(signal.SIGUSR1, lambda *_: _list_candidate_ifaces.cache_clear())
+
     ser = open_serial(args.start_delay)
     print(f"[AtomMan] on {PORT} @ {BAUD} (RTSCTS={RTSCTS} DSRDTR={DSRDTR}; start_delay={args.start_delay:.1f}s; fan={args.fan_prefer}, fan_max_rpm={args.fan_max_rpm})")
 
     latest = {"cpu_model": cpu_model()}
+    if args.dashboard:
+        threading.Thread(target=_dashboard_loop, args=(latest,), daemon=True).start()
 
     activated=False
     for i in range(1, args.attempts+1):
-        activated = unlock_attempt(ser, i, latest, args.window, args.fan_prefer, args.fan_max_rpm, args.dashboard)
+        activated = unlock_attempt(ser, i, latest, args.window, args.fan_prefer, args.fan_max_rpm)
         if activated:
             break
         try:
-            ser.setDTR(False); time.sleep(0.05); ser.setDTR(True)
+            ser.flush()  # don't let the DTR toggle race an in-flight frame
+            ser.setDTR(False); _nap_drain(ser, 0.05); ser.setDTR(True)
         except Exception:
             pass
-        time.sleep(0.3)
+        _nap_drain(ser, 0.3)
 
     if not activated:
         print("[WARN] Screen might not be fully activated; continuing anyway.")
@@ -864,32 +1437,25 @@ def main():
         (DAT,p_date),(NET,lambda: p_net(args.fan_prefer, args.fan_max_rpm)),
         (VOL,p_vol),(BAT,p_bat)
     ]
-    idx=0
-    last_render=0.0
+    rot=itertools.cycle(FULL_ROT)  # C-level rotation: no idx, no modulo
+    _build=_BUILD_SPECIAL          # local alias for the per-tile builders
     while True:
-        enq3=read_enq(ser)
+        # Serial thread sleeps in epoll until RX has bytes or the clock ticks;
+        # the dashboard thread owns all terminal I/O.
+        enq3=read_enq(ser, _poll_to_next_second())
+        now=_tick()
         if enq3 is None:
-            if args.dashboard and (time.time()-last_render>1.0):
-                render_dashboard(latest)
-                last_render=time.time()
             continue
 
-        tile, maker = FULL_ROT[idx % len(FULL_ROT)]
+        tile, maker = next(rot)
         payload = maker()
-        seq = seq_for(tile)
-        frm = build_reply(tile, seq, payload)
-        ser.write(frm); ser.flush(); time.sleep(POST_WRITE_SLEEP)
+        frm = _build[tile](seq_for(tile), payload)
+        # No flush/sleep here: write() lands in the kernel tty buffer and the
+        # next ENQ provides the pacing — draining per frame serialized USB I/O
+        ser.write(frm)
 
         update_latest_from_payload(tile, latest, args.fan_prefer, args.fan_max_rpm)
 
-        if args.dashboard:
-            now=time.time()
-            if now - last_render >= 0.25:
-                render_dashboard(latest)
-                last_render=now
-
-        idx = (idx + 1) % 1_000_000
-
 if __name__=="__main__":
     try:
         main()